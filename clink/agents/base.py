@@ -19,6 +19,28 @@ from clink.parsers import BaseParser, ParsedCLIResponse, ParserError, get_parser
 
 logger = logging.getLogger("clink.agent")
 
+# Successful PATH lookups keyed by (executable name, PATH). Including PATH means a
+# changed search path triggers a fresh lookup. Misses are not cached so a CLI
+# installed while the server is running is picked up on the next request, and hits
+# are re-checked with a single access() call instead of a full PATH walk.
+_EXECUTABLE_CACHE: dict[tuple[str, str], str] = {}
+
+
+def _resolve_executable(executable_name: str) -> str | None:
+    """Return the full path for ``executable_name``, caching successful lookups."""
+
+    cache_key = (executable_name, os.environ.get("PATH", ""))
+    cached = _EXECUTABLE_CACHE.get(cache_key)
+    if cached is not None and os.access(cached, os.X_OK):
+        return cached
+
+    resolved = shutil.which(executable_name)
+    if resolved is None:
+        _EXECUTABLE_CACHE.pop(cache_key, None)
+    else:
+        _EXECUTABLE_CACHE[cache_key] = resolved
+    return resolved
+
 
 @dataclass
 class AgentOutput:
@@ -70,7 +92,7 @@ class BaseCLIAgent:
 
         # Resolve executable path for cross-platform compatibility (especially Windows)
         executable_name = command[0]
-        resolved_executable = shutil.which(executable_name)
+        resolved_executable = _resolve_executable(executable_name)
         if resolved_executable is None:
             raise CLIAgentError(
                 f"Executable '{executable_name}' not found in PATH for CLI '{self.client.name}'. "
@@ -132,6 +154,14 @@ class BaseCLIAgent:
                 f"CLI '{self.client.name}' timed out after {self.client.timeout_seconds} seconds",
                 returncode=None,
             ) from exc
+        except asyncio.CancelledError:
+            # The MCP request was cancelled; don't leave the CLI running in the background.
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:  # pragma: no cover - process exited concurrently
+                    pass
+            raise
 
         duration = time.monotonic() - start_time
         return_code = process.returncode
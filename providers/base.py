@@ -1,6 +1,7 @@
 """Base interfaces and common behaviour for model providers."""
 
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Callable, Optional
@@ -44,6 +45,7 @@ class ModelProvider(ABC):
         self.api_key = api_key
         self.config = kwargs
         self._sorted_capabilities_cache: Optional[list[tuple[str, ModelCapabilities]]] = None
+        self._alias_index_cache: Optional[tuple[dict[str, ModelCapabilities], dict[str, str]]] = None
 
     # ------------------------------------------------------------------
     # Provider identity & capability surface
@@ -102,6 +104,7 @@ class ModelProvider(ABC):
         """Clear cached sorted capability data (call after dynamic updates)."""
 
         self._sorted_capabilities_cache = None
+        self._alias_index_cache = None
 
     def list_models(
         self,
@@ -194,7 +197,7 @@ class ModelProvider(ABC):
         if not text:
             return 0
 
-        estimated = max(1, len(text) // 4)
+        estimated = len(text) // 4 or 1
         logger.debug("Estimating %s tokens for model %s via character heuristic", estimated, resolved_model)
         return estimated
 
@@ -252,7 +255,8 @@ class ModelProvider(ABC):
         Args:
             operation: Callable returning the provider result.
             max_attempts: Maximum number of attempts (>=1).
-            delays: Optional list of sleep durations between attempts.
+            delays: Optional list of maximum sleep durations between attempts.
+                Each sleep is jittered between half and the full value.
             log_prefix: Optional identifier for log clarity.
 
         Returns:
@@ -285,8 +289,11 @@ class ModelProvider(ABC):
                 delay = delays[delay_idx] if delay_idx >= 0 else 0.0
 
                 if delay > 0:
+                    # Equal jitter keeps the configured delay as the upper bound while
+                    # spreading out concurrent callers that failed at the same moment.
+                    delay = delay / 2 + random.uniform(0, delay / 2)
                     logger.warning(
-                        "%s retryable error (attempt %s/%s): %s. Retrying in %ss...",
+                        "%s retryable error (attempt %s/%s): %s. Retrying in %.2fs...",
                         log_prefix or self.__class__.__name__,
                         attempt_number,
                         attempts,
@@ -421,18 +428,32 @@ class ModelProvider(ABC):
             return model_name
 
         # Check case-insensitively for both base models and aliases
-        model_name_lower = model_name.lower()
-
-        # Check base model names case-insensitively
-        for base_model in model_configs:
-            if base_model.lower() == model_name_lower:
-                return base_model
-
-        # Check aliases from the model configurations
-        alias_map = ModelCapabilities.collect_aliases(model_configs)
-        for base_model, aliases in alias_map.items():
-            if any(alias.lower() == model_name_lower for alias in aliases):
-                return base_model
+        canonical = self._get_alias_index(model_configs).get(model_name.lower())
+        if canonical is not None:
+            return canonical
 
         # If not found, return as-is
         return model_name
+
+    def _get_alias_index(self, model_configs: dict[str, ModelCapabilities]) -> dict[str, str]:
+        """Return a lowercase name/alias -> canonical name map for ``model_configs``.
+
+        The index is rebuilt whenever the capability mapping differs from the
+        snapshot it was built from, so dynamic catalogues stay correct.
+        Canonical names take precedence over aliases, and the first model in
+        catalogue order wins when two entries collide.
+        """
+
+        cached = self._alias_index_cache
+        if cached is not None and cached[0] == model_configs:
+            return cached[1]
+
+        index: dict[str, str] = {}
+        for base_model, aliases in ModelCapabilities.collect_aliases(model_configs).items():
+            for alias in aliases:
+                index.setdefault(alias.lower(), base_model)
+        for base_model in reversed(list(model_configs)):
+            index[base_model.lower()] = base_model
+
+        self._alias_index_cache = (dict(model_configs), index)
+        return index
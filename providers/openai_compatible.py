@@ -1,12 +1,17 @@
 """Base class for OpenAI-compatible API providers."""
 
+import ast
+import base64
 import copy
+import functools
 import ipaddress
+import json
 import logging
+import re
 from typing import Optional
 from urllib.parse import urlparse
 
-from openai import OpenAI
+from openai import APIConnectionError, APIStatusError, OpenAI
 
 from utils.env import get_env, suppress_env_vars
 from utils.image_utils import validate_image
@@ -19,6 +24,25 @@ from .shared import (
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _get_tiktoken_encoding(model_name: str):
+    """Return the tiktoken encoding for ``model_name`` or ``None`` without tiktoken.
+
+    Cached so the optional import (including a failed import, which Python does
+    not memoise) and the model→encoding resolution happen once per model.
+    """
+
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class OpenAICompatibleProvider(ModelProvider):
     """Shared implementation for OpenAI API lookalikes.
 
@@ -368,14 +392,15 @@ class OpenAICompatibleProvider(ModelProvider):
         Raises:
             ValueError: If output_text is missing, None, or not a string
         """
-        logging.debug(f"Response object type: {type(response)}")
-        logging.debug(f"Response attributes: {dir(response)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Response object type: %s", type(response))
+            logging.debug("Response attributes: %s", dir(response))
 
         if not hasattr(response, "output_text"):
             raise ValueError(f"o3-pro response missing output_text field. Response type: {type(response).__name__}")
 
         content = response.output_text
-        logging.debug(f"Extracted output_text: '{content}' (type: {type(content)})")
+        logging.debug("Extracted output_text: '%s' (type: %s)", content, type(content))
 
         if content is None:
             raise ValueError("o3-pro returned None for output_text")
@@ -446,12 +471,13 @@ class OpenAICompatibleProvider(ModelProvider):
 
         def _attempt() -> ModelResponse:
             attempt_counter["value"] += 1
-            import json
-
-            sanitized_params = self._sanitize_for_logging(completion_params)
-            logging.info(
-                f"o3-pro API request (sanitized): {json.dumps(sanitized_params, indent=2, ensure_ascii=False)}"
-            )
+            # Sanitizing deep-copies the full prompt; skip it when INFO is disabled
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                sanitized_params = self._sanitize_for_logging(completion_params)
+                logging.info(
+                    "o3-pro API request (sanitized): %s",
+                    json.dumps(sanitized_params, indent=2, ensure_ascii=False),
+                )
 
             response = self.client.responses.create(**completion_params)
 
@@ -725,16 +751,12 @@ class OpenAICompatibleProvider(ModelProvider):
         resolved_model = self._resolve_model_name(model_name)
 
         try:
-            import tiktoken
-
-            try:
-                encoding = tiktoken.encoding_for_model(resolved_model)
-            except KeyError:
-                encoding = tiktoken.get_encoding("cl100k_base")
-
-            return len(encoding.encode(text))
+            encoding = _get_tiktoken_encoding(resolved_model)
+            if encoding is not None:
+                return len(encoding.encode(text))
+            logging.debug("tiktoken unavailable for %s: not installed", resolved_model)
 
-        except (ImportError, Exception) as exc:
+        except Exception as exc:
             logging.debug("tiktoken unavailable for %s: %s", resolved_model, exc)
 
         return super().count_tokens(text, model_name)
@@ -750,6 +772,14 @@ class OpenAICompatibleProvider(ModelProvider):
         Returns:
             True if error should be retried, False otherwise
         """
+        # Typed SDK errors carry the transport failure or HTTP status directly;
+        # 429s still go through the payload inspection below.
+        if isinstance(error, APIConnectionError):
+            return True
+        if isinstance(error, APIStatusError) and error.status_code != 429:
+            # Request timeouts and any 5xx (including proxy codes such as 520/524/529)
+            return error.status_code == 408 or error.status_code >= 500
+
         error_str = str(error).lower()
 
         # Check for 429 errors first - these need special handling
@@ -761,10 +791,6 @@ class OpenAICompatibleProvider(ModelProvider):
             # Parse structured error from OpenAI API response
             # Format: "Error code: 429 - {'error': {'type': 'tokens', 'code': 'rate_limit_exceeded', ...}}"
             try:
-                import ast
-                import json
-                import re
-
                 # Extract JSON part from error string using regex
                 # Look for pattern: {...} (from first { to last })
                 json_match = re.search(r"\{.*\}", str(error))
@@ -843,8 +869,6 @@ class OpenAICompatibleProvider(ModelProvider):
                 image_bytes, mime_type = validate_image(image_path)
 
                 # Read and encode the image
-                import base64
-
                 image_data = base64.b64encode(image_bytes).decode()
                 logging.debug(f"Processing image '{image_path}' as MIME type '{mime_type}'")
 
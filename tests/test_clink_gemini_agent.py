@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from clink.agents import base as agent_base
 from clink.agents.base import CLIAgentError
 from clink.agents.gemini import GeminiAgent
 from clink.models import ResolvedCLIClient, ResolvedCLIRole
@@ -79,3 +80,68 @@ async def test_gemini_agent_propagates_unrecoverable_error(monkeypatch, gemini_a
 
     with pytest.raises(CLIAgentError):
         await _run_agent_with_process(monkeypatch, agent, role, process)
+
+
+@pytest.mark.asyncio
+async def test_gemini_agent_caches_executable_lookup(monkeypatch, tmp_path, gemini_agent):
+    agent, role = gemini_agent
+    monkeypatch.setattr(agent_base, "_EXECUTABLE_CACHE", {})
+
+    executable = tmp_path / "gemini"
+    executable.write_text("#!/bin/sh\n")
+    executable.chmod(0o755)
+    lookups: list[str] = []
+
+    def counting_which(executable_name):
+        lookups.append(executable_name)
+        return str(executable)
+
+    async def fake_create_subprocess_exec(*_args, **_kwargs):
+        return DummyProcess(stdout=b'{"response": "ok"}')
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(shutil, "which", counting_which)
+
+    for _ in range(2):
+        await agent.run(role=role, prompt="do something", files=[], images=[])
+
+    assert lookups == ["gemini"]
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    await agent.run(role=role, prompt="do something", files=[], images=[])
+
+    assert lookups == ["gemini", "gemini"]
+
+
+@pytest.mark.asyncio
+async def test_gemini_agent_kills_process_on_cancel(monkeypatch, gemini_agent):
+    agent, role = gemini_agent
+
+    class HangingProcess:
+        def __init__(self):
+            self.returncode = None
+            self.killed = False
+            self.started = asyncio.Event()
+
+        async def communicate(self, _input):
+            self.started.set()
+            await asyncio.Event().wait()
+
+        def kill(self):
+            self.killed = True
+
+    process = HangingProcess()
+
+    async def fake_create_subprocess_exec(*_args, **_kwargs):
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(shutil, "which", lambda executable_name: f"/usr/bin/{executable_name}")
+
+    task = asyncio.create_task(agent.run(role=role, prompt="do something", files=[], images=[]))
+    await process.started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert process.killed is True
@@ -1,4 +1,5 @@
 import json
+from pathlib import Path
 
 import pytest
 
@@ -185,3 +186,87 @@ async def test_clink_tool_truncates_without_summary(monkeypatch):
     assert metadata.get("output_truncated") is True
     assert metadata.get("events_removed_for_normal") is True
     assert metadata.get("output_original_length") == len(long_text)
+
+
+@pytest.mark.asyncio
+async def test_clink_tool_reads_role_prompt_once(monkeypatch):
+    tool = CLinkTool()
+
+    async def fake_run(**kwargs):
+        return AgentOutput(
+            parsed=ParsedCLIResponse(content="ok", metadata={}),
+            sanitized_command=["gemini"],
+            returncode=0,
+            stdout="{}",
+            stderr="",
+            duration_seconds=0.1,
+            parser_name="gemini_json",
+            output_file_content=None,
+        )
+
+    class DummyAgent:
+        async def run(self, **kwargs):
+            return await fake_run(**kwargs)
+
+    monkeypatch.setattr("tools.clink.create_agent", lambda client: DummyAgent())
+
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def tracking_read_text(self, *args, **kwargs):
+        if self.suffix == ".txt" and "clink" in self.parts:
+            reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read_text)
+
+    arguments = {
+        "prompt": "Hello",
+        "cli_name": "gemini",
+        "role": "default",
+        "absolute_file_paths": [],
+        "images": [],
+    }
+
+    await tool.execute(dict(arguments))
+    await tool.execute(dict(arguments))
+
+    assert len(reads) == 1
+
+
+@pytest.mark.asyncio
+async def test_clink_tool_reuses_agent_per_client(monkeypatch):
+    tool = CLinkTool()
+    created = []
+
+    class DummyAgent:
+        async def run(self, **kwargs):
+            return AgentOutput(
+                parsed=ParsedCLIResponse(content="ok", metadata={}),
+                sanitized_command=["gemini"],
+                returncode=0,
+                stdout="ok",
+                stderr="",
+                duration_seconds=0.1,
+                parser_name="gemini_json",
+                output_file_content=None,
+            )
+
+    def fake_create_agent(client):
+        created.append(client.name)
+        return DummyAgent()
+
+    monkeypatch.setattr("tools.clink.create_agent", fake_create_agent)
+
+    arguments = {
+        "prompt": "Ping",
+        "cli_name": "gemini",
+        "role": "default",
+        "absolute_file_paths": [],
+        "images": [],
+    }
+
+    await tool.execute(dict(arguments))
+    await tool.execute(dict(arguments))
+
+    assert created == ["gemini"]
@@ -71,3 +71,26 @@ def test_openai_provider_bails_on_non_retryable_error(monkeypatch):
 
     assert "after 1 attempt" in str(excinfo.value)
     assert attempts["count"] == 1
+
+
+def test_retry_delays_are_jittered_within_configured_bounds(monkeypatch):
+    """Retry sleeps should stay between half and the full configured delay."""
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("providers.base.time.sleep", sleeps.append)
+
+    provider = OpenAIModelProvider(api_key="test-key")
+    attempts = {"count": 0}
+
+    def flaky_operation():
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise RuntimeError("temporary network interruption")
+        return "ok"
+
+    result = provider._run_with_retries(flaky_operation, max_attempts=3, delays=[2, 4])
+
+    assert result == "ok"
+    assert len(sleeps) == 2
+    assert 1 <= sleeps[0] <= 2
+    assert 2 <= sleeps[1] <= 4
@@ -138,3 +138,25 @@ def test_edge_cases_and_fallbacks():
 
     simple_429_error = MockSimple429Error()
     assert provider._is_error_retryable(simple_429_error), "Simple 429 without type info should be retryable"
+
+
+def test_openai_sdk_exceptions_classified_by_type():
+    """Typed SDK errors are classified from their status, not their message text."""
+    import httpx
+    from openai import APIConnectionError, APIStatusError, APITimeoutError
+
+    provider = OpenAIModelProvider(api_key="test-key")
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    def status_error(code, message):
+        response = httpx.Response(code, request=request)
+        return APIStatusError(message, response=response, body=None)
+
+    assert provider._is_error_retryable(APIConnectionError(request=request))
+    assert provider._is_error_retryable(APITimeoutError(request=request))
+    assert provider._is_error_retryable(status_error(503, "Service Unavailable"))
+    assert provider._is_error_retryable(status_error(524, "A timeout occurred"))
+    assert provider._is_error_retryable(status_error(529, "Provider temporarily unavailable"))
+    # A 400 whose message happens to mention a timeout must not be retried
+    assert not provider._is_error_retryable(status_error(400, "Invalid prompt: 'timeout' is not allowed"))
+    assert not provider._is_error_retryable(status_error(401, "Unauthorized"))
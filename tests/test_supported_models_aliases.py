@@ -3,6 +3,7 @@
 from providers.dial import DIALModelProvider
 from providers.gemini import GeminiModelProvider
 from providers.openai import OpenAIModelProvider
+from providers.shared import ModelCapabilities, ProviderType
 from providers.xai import XAIModelProvider
 
 
@@ -221,3 +222,20 @@ class TestSupportedModelsAliases:
             assert provider._resolve_model_name("unknown-model") == "unknown-model"
             assert provider._resolve_model_name("gpt-4") == "gpt-4"
             assert provider._resolve_model_name("claude-3") == "claude-3"
+
+    def test_resolve_picks_up_catalogue_changes(self):
+        """The cached alias index must be rebuilt when the catalogue changes."""
+        provider = GeminiModelProvider("test-key")
+        assert provider._resolve_model_name("custom-alias") == "custom-alias"
+
+        extra = ModelCapabilities(
+            provider=ProviderType.GOOGLE,
+            model_name="gemini-custom",
+            friendly_name="Gemini Custom",
+            aliases=["custom-alias"],
+        )
+        updated = {**provider.get_all_model_capabilities(), "gemini-custom": extra}
+        provider.get_all_model_capabilities = lambda: updated
+
+        assert provider._resolve_model_name("Custom-Alias") == "gemini-custom"
+        assert provider._resolve_model_name("flash") == "gemini-2.5-flash"
@@ -12,7 +12,7 @@ from mcp.types import TextContent
 from pydantic import BaseModel, Field
 
 from clink import get_registry
-from clink.agents import AgentOutput, CLIAgentError, create_agent
+from clink.agents import AgentOutput, BaseCLIAgent, CLIAgentError, create_agent
 from clink.models import ResolvedCLIClient, ResolvedCLIRole
 from config import TEMPERATURE_BALANCED
 from tools.models import ToolModelCategory, ToolOutput
@@ -71,6 +71,8 @@ class CLinkTool(SimpleTool):
         else:
             self._default_cli_name = self._cli_names[0] if self._cli_names else None
         self._active_system_prompt: str = ""
+        self._role_prompt_cache: dict[Path, str] = {}
+        self._agent_cache: dict[str, BaseCLIAgent] = {}
         super().__init__()
 
     def get_name(self) -> str:
@@ -189,7 +191,7 @@ class CLinkTool(SimpleTool):
 
         self._model_context = arguments.get("_model_context")
 
-        system_prompt_text = role_config.prompt_path.read_text(encoding="utf-8")
+        system_prompt_text = self._load_role_prompt(role_config)
         include_system_prompt = not self._use_external_system_prompt(client_config)
 
         try:
@@ -203,7 +205,7 @@ class CLinkTool(SimpleTool):
             logger.exception("Failed to prepare clink prompt")
             self._raise_tool_error(f"Failed to prepare prompt: {exc}")
 
-        agent = create_agent(client_config)
+        agent = self._get_agent(client_config)
         try:
             result = await agent.run(
                 role=role_config,
@@ -261,7 +263,7 @@ class CLinkTool(SimpleTool):
     async def prepare_prompt(self, request) -> str:
         client_config = self._registry.get_client(request.cli_name)
         role_config = client_config.get_role(request.role)
-        system_prompt_text = role_config.prompt_path.read_text(encoding="utf-8")
+        system_prompt_text = self._load_role_prompt(role_config)
         include_system_prompt = not self._use_external_system_prompt(client_config)
         return await self._prepare_prompt_for_role(
             request,
@@ -298,6 +300,26 @@ class CLinkTool(SimpleTool):
         finally:
             self._active_system_prompt = ""
 
+    def _load_role_prompt(self, role: ResolvedCLIRole) -> str:
+        """Return the role prompt text, reading each prompt file only once."""
+        prompt_text = self._role_prompt_cache.get(role.prompt_path)
+        if prompt_text is None:
+            prompt_text = role.prompt_path.read_text(encoding="utf-8")
+            self._role_prompt_cache[role.prompt_path] = prompt_text
+        return prompt_text
+
+    def _get_agent(self, client: ResolvedCLIClient) -> BaseCLIAgent:
+        """Return the runner for ``client``, creating it on first use.
+
+        Agents only hold their client config and logger, so one instance can
+        safely serve concurrent calls.
+        """
+        agent = self._agent_cache.get(client.name)
+        if agent is None:
+            agent = create_agent(client)
+            self._agent_cache[client.name] = agent
+        return agent
+
     def _use_external_system_prompt(self, client: ResolvedCLIClient) -> bool:
         runner_name = (client.runner or client.name).lower()
         return runner_name == "claude"
@@ -319,8 +341,9 @@ class CLinkTool(SimpleTool):
         }
         metadata.update(result.parsed.metadata)
 
-        if result.stderr.strip():
-            metadata.setdefault("stderr", result.stderr.strip())
+        stderr = result.stderr.strip()
+        if stderr:
+            metadata.setdefault("stderr", stderr)
         if result.output_file_content and "raw" not in metadata:
             metadata["raw_output_file"] = result.output_file_content
         return metadata
@@ -52,22 +52,22 @@ class InMemoryStorage:
     def set_with_ttl(self, key: str, ttl_seconds: int, value: str) -> None:
         """Store value with expiration time"""
         with self._lock:
-            expires_at = time.time() + ttl_seconds
+            expires_at = time.monotonic() + ttl_seconds
             self._store[key] = (value, expires_at)
-            logger.debug(f"Stored key {key} with TTL {ttl_seconds}s")
+            logger.debug("Stored key %s with TTL %ss", key, ttl_seconds)
 
     def get(self, key: str) -> Optional[str]:
         """Retrieve value if not expired"""
         with self._lock:
             if key in self._store:
                 value, expires_at = self._store[key]
-                if time.time() < expires_at:
-                    logger.debug(f"Retrieved key {key}")
+                if time.monotonic() < expires_at:
+                    logger.debug("Retrieved key %s", key)
                     return value
                 else:
                     # Clean up expired entry
                     del self._store[key]
-                    logger.debug(f"Key {key} expired and removed")
+                    logger.debug("Key %s expired and removed", key)
         return None
 
     def setex(self, key: str, ttl_seconds: int, value: str) -> None:
@@ -83,13 +83,13 @@ class InMemoryStorage:
     def _cleanup_expired(self):
         """Remove all expired entries"""
         with self._lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             expired_keys = [k for k, (_, exp) in self._store.items() if exp < current_time]
             for key in expired_keys:
                 del self._store[key]
 
             if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired conversation threads")
+                logger.debug("Cleaned up %d expired conversation threads", len(expired_keys))
 
     def shutdown(self):
         """Graceful shutdown of background thread"""